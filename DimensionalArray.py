@@ -1,12 +1,27 @@
-from numpy import ndarray, array, int8, sum
+from numpy import ndarray, array, int8
 from __syntax import Unit
 from exceptions import BadUnitException
 
 
 
-class DimensionalArray(ndarray):
+class DimensionalArray(tuple):
+    """
+    Immutable and hashable vector of the 7 exponents of the base dimensions.
+    For instance, a speed is DimensionalArray(length_exponent=1, time_exponent=-1).
 
-    __slots__ = ('__as_array',)
+    The exponents are plain python integers stored in a tuple, so the dimension algebra
+    (addition, scaling, equality, hashing) never allocates numpy arrays:
+
+    >>> speed = DimensionalArray(length_exponent=1, time_exponent=-1)
+    >>> speed + DimensionalArray(time_exponent=1)
+    DimensionalArray(1, 0, 0, 0, 0, 0, 0)
+    >>> speed * 2
+    DimensionalArray(2, -2, 0, 0, 0, 0, 0)
+
+    A numpy view of the exponents is still available through the as_array property.
+    """
+
+    __slots__ = ()
 
     LENGTH_INDEX = 0
     TIME_INDEX = 1
@@ -16,6 +31,8 @@ class DimensionalArray(ndarray):
     ELECTRIC_CURRENT_INDEX = 5
     LIGHT_INTENSITY_INDEX = 6
 
+    __arrays = dict()  # {(1, -1, 0, 0, 0, 0, 0): ndarray([1, -1, 0, 0, 0, 0, 0]), ...}
+
 
 
     def __new__\
@@ -31,33 +48,23 @@ class DimensionalArray(ndarray):
             ):
         data_as_tuple = \
             (
-                length_exponent,
-                time_exponent,
-                mass_exponent,
-                temperature_exponent,
-                substance_amount_exponent,
-                electric_current_exponent,
-                light_intensity_exponent
+                int(length_exponent),
+                int(time_exponent),
+                int(mass_exponent),
+                int(temperature_exponent),
+                int(substance_amount_exponent),
+                int(electric_current_exponent),
+                int(light_intensity_exponent)
             )
-        dimensional_array = array(data_as_tuple, dtype=int8)
-        return dimensional_array.view(cls)
+        return super(DimensionalArray, cls).__new__(cls, data_as_tuple)
 
 
 
-    def __init__ \
-            (
-                self,
-                length_exponent: int = 0,
-                time_exponent: int = 0,
-                mass_exponent: int = 0,
-                temperature_exponent: int = 0,
-                substance_amount_exponent: int = 0,
-                electric_current_exponent: int = 0,
-                light_intensity_exponent: int = 0
-            ) -> None:
-        self.__as_array = self.view(ndarray)
-        self.setflags(write=False)
-        return
+    def __getnewargs__(self) -> tuple:
+        """
+        Needed by pickle, as the exponents are passed one by one to __new__.
+        """
+        return tuple(self)
 
 
 
@@ -82,31 +89,56 @@ class DimensionalArray(ndarray):
 
 
 
-    def __array_finalize__(self, obj):
-        if type(obj) is DimensionalArray:
-            DimensionalArray.__init__(obj)
-        return
+    def __add__(self, other):
+        """
+        Element-wise addition, like numpy arrays (and unlike tuples, which would be concatenated).
+        """
+        return DimensionalArray(*[exponent + other_exponent for exponent, other_exponent in zip(self, other)])
+
+
+
+    def __sub__(self, other):
+        return DimensionalArray(*[exponent - other_exponent for exponent, other_exponent in zip(self, other)])
+
+
+
+    def __mul__(self, factor: int):
+        """
+        Scaling of all the exponents, like numpy arrays (and unlike tuples, which would be repeated).
+        """
+        return DimensionalArray(*[exponent * factor for exponent in self])
+
+    __rmul__ = __mul__
+
+
+
+    def __neg__(self):
+        return self * -1
 
 
 
     if __debug__:
 
         def __repr__(self) -> str:
-            return f"{self.__class__.__name__}({', '.join(self)})"
+            return f"{self.__class__.__name__}({', '.join([str(exponent) for exponent in self])})"
 
     def __get_array_view(self) -> ndarray:
+        """
+        as_array      -->     _     ndarray     Read Only
+
+        The exponents as a read only numpy array of int8. Arrays are shared between equal dimensional arrays.
+        """
         try:
-            return self.__as_array
-        except AttributeError:
-            as_array = self.view(ndarray)
-            self.__as_array = as_array
+            return self.__arrays[self]
+        except KeyError:
+            as_array = array(self, dtype=int8)
+            as_array.setflags(write=False)
+            self.__arrays[tuple(self)] = as_array
             return as_array
 
-
     as_array = property(fget=__get_array_view, doc=f"{__get_array_view.__doc__}")
 
     def __is_elementary(self) -> bool:
-        this_as_array = self.view(ndarray)
-        return sum(this_as_array) == 1 and sum(this_as_array == 1) == 1
+        return sum(self) == 1 and self.count(1) == 1
 
     is_elementary = property(fget=__is_elementary, doc=f"{__is_elementary.__doc__}")
@@ -0,0 +1,226 @@
+from numpy import ndarray, asarray, float64
+
+
+
+class QuantityArray(ndarray):
+    """
+    Vectorized counterpart of the dimension classes.
+
+    A QuantityArray is a float64 numpy array carrying ONE unit for all its values. The unit string
+    is parsed once, when the array is created, through the regular scalar machinery of the dimension
+    class. Afterwards, every value of the array shares the same unit map, the same factor from the
+    international system and the same dimension class. Thus, a conversion costs one vectorized
+    multiplication instead of one python object per value.
+
+    You normally do not instantiate this class directly, but through the dimension classes:
+
+    >>> from dimensions import Length
+    >>> distances = Length.array([1.0, 2.5, 4.0], 'km')
+    >>> distances
+    [1.  2.5 4. ] km
+    >>> distances.convert('mil')
+    [0.62137119 1.55342798 2.48548477] mil
+
+    Indexing a single value gives back a regular scalar quantity:
+
+    >>> distances[1]
+    2.5 km
+
+
+
+    ███████╗ ██╗      ██████╗ ████████╗ ███████╗
+    ██╔════╝ ██║     ██╔═══██╗╚══██╔══╝ ██╔════╝
+    ███████╗ ██║     ██║   ██║   ██║    ███████╗
+    ╚════██║ ██║     ██║   ██║   ██║    ╚════██║
+    ███████║ ███████╗╚██████╔╝   ██║    ███████║
+    ╚══════╝ ╚══════╝ ╚═════╝    ╚═╝    ╚══════╝
+
+    _dimension_class    type        The dimension class (Length, Speed, etc...) of all the values.
+    _unit_map           list        List of UnitContext objects, shared by all the values.
+    _factor_from_si     float       If the values are multiplied by this factor,
+                                    it allows to convert them to international unit
+    """
+
+    __slots__ = ('_dimension_class', '_unit_map', '_factor_from_si')
+
+
+
+    def __new__(cls, values, dimension_class: type, unit: str):
+        """
+        @param values               array_like      Numbers, all expressed in @unit
+        @param dimension_class      type            The dimension class of the values (Length, Pressure, etc...)
+        @param unit                 str             The unit symbol, for instance 'km' or 'm sec-1'
+
+        @return                     QuantityArray
+
+        The unit is resolved once, by building a reference quantity worth 1 @unit.
+        Affine units (for instance Celsius degrees for a Temperature) are detected by building a
+        second reference quantity worth 0 @unit. In that case, values are shifted accordingly.
+        """
+        reference = dimension_class(1.0, unit)
+        if not isinstance(reference, dimension_class):
+            raise TypeError(f"{dimension_class.__name__} is adimensional. Use a regular numpy array instead.")
+        values_as_array = asarray(values, dtype=float64)
+        origin = float(dimension_class(0.0, unit))
+        if origin != 0.0 or float(reference) != 1.0:
+            values_as_array = values_as_array * (float(reference) - origin) + origin
+        return cls._wrap(values_as_array, dimension_class, reference._unit_map, reference.factor_from_si)
+
+
+
+    @classmethod
+    def _wrap(cls, values: ndarray, dimension_class: type, unit_map: list, factor_from_si: float):
+        """
+        @param values               ndarray         Float64 numbers, already expressed in the unit of @unit_map
+        @param dimension_class      type            The dimension class of the values
+        @param unit_map             list            List of UnitContext objects
+        @param factor_from_si       float           The factor from the international system of @unit_map
+
+        @return                     QuantityArray   A view of @values tagged with the unit. No copy is performed.
+
+        Internal constructor. No unit parsing is done there, metadata are just attached to the buffer.
+        """
+        quantity_array = values.view(cls)
+        quantity_array._dimension_class = dimension_class
+        quantity_array._unit_map = unit_map
+        quantity_array._factor_from_si = factor_from_si
+        return quantity_array
+
+
+
+    def convert(self, new_unit: str):
+        """
+        @param new_unit     str                     The symbol of a unit to perform the conversion
+
+        @return             QuantityArray           The converted array
+
+        @raise              IncompatibleUnitError   If trying to convert a dimension to a unit which does not
+                                                    belong to that dimension.
+
+        The conversion factor is computed once on a reference scalar quantity,
+        then applied to the whole array in a single multiplication.
+        """
+        converted_unit = self.unit.convert(new_unit)
+        return self._wrap\
+            (
+                self.as_array * float(converted_unit),
+                self._dimension_class,
+                converted_unit._unit_map,
+                converted_unit.factor_from_si
+            )
+
+
+
+    def __array_ufunc__(self, ufunc, method: str, *inputs, **kwargs):
+        """
+        Magic method automatically called by numpy when a ufunc (np.add, np.sqrt, "*" operator, etc...)
+        is applied on the array. The dimension of the result is computed once for the whole array
+        by the dimension class, then the ufunc runs on the raw float64 buffers.
+        """
+        return self._dimension_class._UFUNC_DISPATCHER.dispatch(ufunc, method, inputs, kwargs)
+
+
+
+    def __array_finalize__(self, obj) -> None:
+        """
+        Magic method called by numpy each time a new array is derived from @obj (view, slice, copy...).
+        The derived array keeps the unit of @obj.
+        """
+        self._dimension_class = getattr(obj, '_dimension_class', None)
+        self._unit_map = getattr(obj, '_unit_map', None)
+        self._factor_from_si = getattr(obj, '_factor_from_si', None)
+        return
+
+
+
+    def __getitem__(self, item):
+        """
+        Slicing gives a QuantityArray, while picking a single value gives a scalar quantity.
+        """
+        value = super(QuantityArray, self).__getitem__(item)
+        if isinstance(value, QuantityArray):
+            return value
+        return self._dimension_class._from_unit_map(float(value), self._unit_map, self._factor_from_si)
+
+
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+
+    def __reduce__(self) -> tuple:
+        """
+        numpy only pickles the buffer of an array. The unit metadata are appended to the
+        numpy state so that they survive a pickle dump / load round trip.
+        """
+        reconstructor, arguments, numpy_state = super(QuantityArray, self).__reduce__()
+        unit_state = (self._dimension_class, self._unit_map, self._factor_from_si)
+        return reconstructor, arguments, (numpy_state, unit_state)
+
+
+
+    def __setstate__(self, state: tuple) -> None:
+        numpy_state, (self._dimension_class, self._unit_map, self._factor_from_si) = state
+        super(QuantityArray, self).__setstate__(numpy_state)
+        return
+
+
+
+    def __str__(self) -> str:
+        return f"{self.as_array} {self.symbol}"
+
+
+
+    if __debug__:
+
+        def __repr__(self) -> str:
+            return self.__str__()
+
+
+
+    def __get_array_view(self) -> ndarray:
+        """
+        as_array      -->     _     ndarray     Read Only
+
+        The raw float64 values, as a regular numpy array (no copy).
+        """
+        return self.view(ndarray)
+
+    as_array = property(fget=__get_array_view, doc=f"{__get_array_view.__doc__}")
+
+    def __get_unit(self):
+        """
+        unit      -->     _     AbstractQuantity     Read Only
+
+        A scalar quantity worth 1 unit of the array. For instance, Length(1.0, 'km').
+        """
+        return self._dimension_class._from_unit_map(1.0, self._unit_map, self._factor_from_si)
+
+    unit = property(fget=__get_unit, doc=f"{__get_unit.__doc__}")
+
+    def __get_dimension_class(self) -> type:
+        return self._dimension_class
+
+    dimension_class = property(fget=__get_dimension_class, doc=f"{__get_dimension_class.__doc__}")
+
+    def __get_symbol(self) -> str:
+        return ' '.join([context.symbol for context in self._unit_map])
+
+    symbol = property(fget=__get_symbol, doc=f"{__get_symbol.__doc__}")
+
+    def __get_full_name(self) -> str:
+        return ' '.join([context.long_name for context in self._unit_map])
+
+    unit_full_name = property(fget=__get_full_name, doc=f"{__get_full_name.__doc__}")
+
+    def __get_factor_from_si(self) -> float:
+        return self._factor_from_si
+
+    factor_from_si = property(fget=__get_factor_from_si, doc=f"{__get_factor_from_si.__doc__}")
+
+    def __get_is_si(self) -> bool:
+        return self._factor_from_si == 1.0
+
+    is_si = property(fget=__get_is_si, doc=f"{__get_is_si.__doc__}")
@@ -4,13 +4,18 @@ from __syntax.Prefix import Prefix
 
 class Unit(object):
 
-    __slots__ = ('__symbol', '__long_name', '__detection_regexp')
+    __slots__ = ('__symbol', '__long_name', '__detection_regexp', '__rank')
 
     __PREFIX = 'prefix'
     __SYMBOL = 'symbol'
     __EXPONENT = 'exponent'
+    # Same prefixes, in the same order, as the ones of the detection regexp.
+    __PREFIX_SYMBOLS = ('da', 'Y', 'Z', 'E', 'P', 'T', 'G', 'M', 'k', 'K', 'h', 'H', 'd', 'c', 'm', 'µ', 'n', 'p', 'f', 'a', 'z', 'y')
+    __DIGITS = '0123456789'
 
     __instances = dict()
+    # {'km': [(creation rank, prefix length, kilo Prefix, meter Unit), ...], ...}. Built at first lookup.
+    __symbol_index = None
 
 
 
@@ -20,15 +25,20 @@ class Unit(object):
             instance = cls.__instances[long_name]
         except KeyError:
             instance = super(Unit, cls).__new__(cls)
+            instance.__rank = len(cls.__instances)  # Order of creation, to sort lookup results.
             cls.__instances[long_name] = instance
         return instance
 
 
 
     def __init__(self, symbol: str, long_name: str) -> None:
+        if self.__symbol_index is not None:
+            self.__remove_from_symbol_index()
         self.__long_name = str(long_name)
         self.__symbol = str(symbol)
         self.__detection_regexp = self.__craft_detection_regexp(self.__symbol)
+        if self.__symbol_index is not None:
+            self.__add_to_symbol_index()
         return
 
 
@@ -66,14 +76,29 @@ class Unit(object):
 
     @classmethod
     def get_unit_from_raw_symbol(cls, raw_symbol: str) -> tuple:
-        returned_symbols = list()
-        for unit in cls.__instances.values():
-            prefix, symbol, exponent = unit.match_raw_symbol(raw_symbol)
-            if (prefix, symbol, exponent) != (None, None, None):
-                returned_symbols.append((prefix, symbol, exponent))
-        if not returned_symbols:
+        """
+        @param raw_symbol       str         A single unit token, for instance 'km', 'sec-1' or 'mmHg'
+
+        @return                 tuple       All the possible interpretations of @raw_symbol,
+                                            as (Prefix, Unit, exponent) tuples
+
+        @raise                  ValueError  If @raw_symbol can not be associated with any unit.
+
+        Each possible spelling (prefix + symbol) of every unit is stored in an index, so this method just
+        probes the index for each way to split @raw_symbol into a spelling and an exponent. The result is the
+        same as calling match_raw_symbol on every unit ever created, which is what this method used to do.
+        """
+        if cls.__symbol_index is None:
+            cls.__build_symbol_index()
+        best_matches = dict()
+        for spelling, exponent in cls.__split_exponent(raw_symbol):
+            for rank, prefix_length, prefix, unit in cls.__symbol_index.get(spelling, ()):
+                # Like the detection regexp, the longest prefix wins if a unit matches in several ways.
+                if unit not in best_matches or best_matches[unit][1] < prefix_length:
+                    best_matches[unit] = (rank, prefix_length, (prefix, unit, exponent))
+        if not best_matches:
             raise ValueError(f"{raw_symbol} is not associated with any unit.")
-        return tuple(returned_symbols)
+        return tuple([match for _, _, match in sorted(best_matches.values(), key=lambda item: item[0])])
 
 
 
@@ -92,6 +117,60 @@ class Unit(object):
 
 
 
+    @classmethod
+    def __split_exponent(cls, raw_symbol: str):
+        """
+        @param raw_symbol       str         A single unit token, for instance 'km-2'
+
+        @return                 generator   All the (spelling, exponent) couples @raw_symbol can be split into.
+                                            For instance ('km-2', 1), ('km-', 2) and ('km', -2).
+        """
+        yield raw_symbol, 1
+        index = len(raw_symbol)
+        while index > 0 and raw_symbol[index - 1] in cls.__DIGITS:
+            index -= 1
+            yield raw_symbol[:index], int(raw_symbol[index:])
+            if index > 0 and raw_symbol[index - 1] == '-':
+                yield raw_symbol[:index - 1], int(raw_symbol[index - 1:])
+
+
+
+    @classmethod
+    def __build_symbol_index(cls) -> None:
+        cls.__symbol_index = dict()
+        for unit in cls.__instances.values():
+            unit.__add_to_symbol_index()
+        return
+
+
+
+    def __add_to_symbol_index(self) -> None:
+        rank = self.__rank
+        symbol_index = self.__symbol_index
+        for prefix_symbol in ('', *self.__PREFIX_SYMBOLS):
+            prefix = Prefix.init_from_single_value(prefix_symbol)
+            entry = (rank, len(prefix_symbol), prefix, self)
+            symbol_index.setdefault(f"{prefix_symbol}{self.__symbol}", list()).append(entry)
+        return
+
+
+
+    def __remove_from_symbol_index(self) -> None:
+        try:
+            symbol = self.__symbol
+        except AttributeError:  # If the unit is being created, it is not indexed yet.
+            return
+        for prefix_symbol in ('', *self.__PREFIX_SYMBOLS):
+            spelling = f"{prefix_symbol}{symbol}"
+            entries = [entry for entry in self.__symbol_index.get(spelling, ()) if entry[3] is not self]
+            if entries:
+                self.__symbol_index[spelling] = entries
+            else:
+                self.__symbol_index.pop(spelling, None)
+        return
+
+
+
     def __craft_detection_regexp(self, symbol: str):
         prefix = self.__PREFIX
         symbol_group = self.__SYMBOL
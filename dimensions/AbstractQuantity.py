@@ -1,11 +1,14 @@
-from itertools import product
 from re import compile, match
 from math import prod, pow as power
+from numpy import ndarray, asarray, frombuffer, fromiter, float64
 from numpy.core import number
 
 from __syntax import Prefix, UnitContext, Unit
 from DimensionalArray import DimensionalArray
+from QuantityArray import QuantityArray
 from ._MetaQuantity import _MetaQuantity
+from ._UfuncDispatcher import _UfuncDispatcher
+from ._LruCache import _LruCache
 from exceptions import MissingUnitException, BadUnitException
 from .exceptions import IncompatibleUnitError
 
@@ -52,8 +55,10 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
     _NUMBER_DETECTION_REGEXP = compile(r'^[0123456789.-]+')
     _DIMENSIONAL_ARRAY = DimensionalArray(127, 127, 127, 127, 127, 127, 127)
     _UNITS = dict()
+    _UFUNC_DISPATCHER = _UfuncDispatcher
 
-    __context_cache = dict()
+    # {(Length, 'km h-1'): (unit map, factor from SI), ...}. Shared by all the dimension classes.
+    __context_cache = _LruCache(max_size=1024)
 
 
 
@@ -157,8 +162,7 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
         if type(self) != type(other):
             raise IncompatibleUnitError(f"{str(self)} and {str(other)} have incompatible unit. Impossible to convert.")
         conversion_factor = self._factor_from_si / other.factor_from_si
-        new_unit = other.symbol
-        return self.__class__(float(self) * conversion_factor, new_unit)
+        return self._from_unit_map(float(self) * conversion_factor, other._unit_map, other.factor_from_si)
 
 
 
@@ -197,7 +201,7 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
         this_class = self.__class__
         other_class = other.__class__
         if this_class is other_class:
-            return self.convert(other.symbol)
+            return self.align_to(other)
         self_unit_map = self._unit_map.copy()
         other_unit_map_dict = \
             {
@@ -221,16 +225,19 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
             # if bar         is not mmHg  ## Then we want to convert mmHg to bar
             if analyzed_unit is not already_mapped_elementary_unit:
                 unit_conversion_map = unit_dimension_class.UNITS
-                conversion_factor *= unit_conversion_map[analyzed_unit] / unit_conversion_map[already_mapped_elementary_unit]
+                unit_ratio = unit_conversion_map[analyzed_unit] / unit_conversion_map[already_mapped_elementary_unit]
+                conversion_factor *= pow(unit_ratio, context.exponent)
                 new_unit = already_mapped_elementary_unit
             # if kilo          is not milli  ## Then we want to convert milli to kilo
             if analyzed_prefix is not already_mapped_prefix:
-                conversion_factor *= pow(10, analyzed_prefix.ten_power - already_mapped_prefix.ten_power)
+                ten_power = analyzed_prefix.ten_power - already_mapped_prefix.ten_power
+                conversion_factor *= pow(10, ten_power * context.exponent)
                 new_prefix = already_mapped_prefix
             new_context = UnitContext(context.exponent, new_unit, new_prefix)
             final_unit_map.append(new_context)
-        final_symbol = self.__get_unit_label(final_unit_map)
-        return self.__class__(float(self) * conversion_factor, final_symbol)
+        final_unit_map.sort(reverse=True, key=lambda x: x.exponent)
+        factor_from_si = self.__get_factor_from_si(final_unit_map)
+        return self._from_unit_map(float(self) * conversion_factor, final_unit_map, factor_from_si)
 
 
 
@@ -262,7 +269,8 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
         except (LookupError, ValueError):
             raise IncompatibleUnitError(f"{new_unit} is incompatible with {self.symbol}") from None
         conversion_factor = self._factor_from_si / new_quantity.factor_from_si
-        return new_quantity * conversion_factor
+        return self._from_unit_map(float(new_quantity) * conversion_factor, new_quantity._unit_map,
+                                   new_quantity.factor_from_si)
 
 
 
@@ -274,16 +282,97 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
             prefix = context.prefix
             corresponding_class = _MetaQuantity.which_dimension_has(elementary_unit)
             if exponent != 1:
-                powered_dimension_class = pow(corresponding_class, exponent)
-                exponent_str = exponent if exponent not in (0, 1) else ''
-                decomposed.append(powered_dimension_class(1.0, f"{prefix.symbol}{elementary_unit.symbol}{exponent_str}"))
-            else:
-                exponent_str = exponent if exponent not in (0, 1) else ''
-                decomposed.append(corresponding_class(1.0, f"{prefix.symbol}{elementary_unit.symbol}{exponent_str}"))
+                corresponding_class = pow(corresponding_class, exponent)
+            unit_map = [UnitContext(exponent, elementary_unit, prefix)]
+            decomposed.append(corresponding_class._from_unit_map(1.0, unit_map, self.__get_factor_from_si(unit_map)))
         return tuple(decomposed)
 
 
 
+    @classmethod
+    def array(cls, values, unit: str) -> QuantityArray:
+        """
+        @param values       array_like          A sequence (list, tuple, numpy array...) of numbers
+        @param unit         str                 The unit in which all the numbers are expressed
+
+        @return             QuantityArray       A float64 array tagged with @unit
+
+        This method is intended to handle large amount of values belonging to the same dimension.
+        Instead of building one quantity object per value, all the values are stored in a single
+        float64 buffer sharing one unit. The unit string is parsed only once.
+
+        Example:
+
+        >>> from dimensions import Length
+        >>> distances = Length.array([1.0, 2.5, 4.0], 'km')
+        >>> distances
+        [1.  2.5 4. ] km
+        >>> distances.convert('m')
+        [1000. 2500. 4000.] m
+        """
+        return QuantityArray(values, cls, unit)
+
+
+
+    @classmethod
+    def from_buffer(cls, buffer, unit: str, dtype=None) -> QuantityArray:
+        """
+        @param buffer       Any                 Any object supporting the buffer protocol: numpy array,
+                                                array.array, bytes, bytearray, memoryview, etc...
+        @param unit         str                 The unit in which all the numbers are expressed
+        @param dtype        numpy.dtype         The type of the numbers stored in @buffer. If not provided,
+                                                it is read from the buffer format. Raw bytes are read as float64.
+
+        @return             QuantityArray       The numbers of @buffer tagged with @unit
+
+        Bulk constructor intended for massive data ingestion. The unit is resolved once, and
+        no python object is created per value. If the numbers are already float64, no copy
+        is performed: the returned array is a view on @buffer.
+
+        Example:
+
+        >>> from array import array
+        >>> from dimensions import Pressure
+        >>> raw_data = array('d', [1013.25, 1009.8, 998.1])
+        >>> Pressure.from_buffer(raw_data, 'hPa')
+        [1013.25 1009.8   998.1 ] hPa
+        >>> Pressure.from_buffer(raw_data.tobytes(), 'hPa')  # Raw bytes are read as float64
+        [1013.25 1009.8   998.1 ] hPa
+        """
+        if isinstance(buffer, ndarray):
+            values = buffer.view(ndarray) if dtype is None else buffer.view(dtype)
+        else:
+            buffer_view = memoryview(buffer)
+            if dtype is None and buffer_view.format in ('B', 'b', 'c'):  # Raw bytes
+                dtype = float64
+            values = asarray(buffer_view) if dtype is None else frombuffer(buffer_view, dtype=dtype)
+        return QuantityArray(values, cls, unit)
+
+
+
+    @classmethod
+    def from_iterable(cls, iterable, unit: str, count: int = -1) -> QuantityArray:
+        """
+        @param iterable     Iterable            Any iterable (generator, list, etc...) yielding numbers
+        @param unit         str                 The unit in which all the numbers are expressed
+        @param count        int                 The number of items to read from @iterable.
+                                                -1 means all of them.
+
+        @return             QuantityArray       The numbers of @iterable tagged with @unit
+
+        Bulk constructor intended for massive data ingestion. Numbers are directly written in a
+        float64 buffer, without creating any quantity object, and the unit is resolved once.
+
+        Example:
+
+        >>> from dimensions import Length
+        >>> Length.from_iterable((x / 10 for x in range(3)), 'km')
+        [0.  0.1 0.2] km
+        """
+        return QuantityArray(fromiter(iterable, dtype=float64, count=count), cls, unit)
+
+
+
     @classmethod
     def sum(cls, sequence_of_quantities: list | tuple | set | frozenset):
         """
@@ -316,12 +405,47 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
 
 
 
+    @classmethod
+    def get_context_cache_statistics(cls) -> dict:
+        """
+        @return     dict        Usage of the cache of parsed units, shared by all the dimension classes:
+                                {'size': 12, 'max_size': 1024, 'hits': 950, 'misses': 12, 'evictions': 0,
+                                 'hit_rate': 0.9875...}
+        """
+        return cls.__context_cache.statistics
+
+
+
+    @classmethod
+    def set_context_cache_size(cls, max_size: int | None) -> None:
+        """
+        @param max_size     int | None      The maximum number of parsed units kept in memory. None means unbounded.
+
+        @raise              ValueError      If @max_size is not a positive integer.
+
+        When the cache is full, the least recently used unit is evicted.
+        """
+        cls.__context_cache.resize(max_size)
+        return
+
+
+
+    @classmethod
+    def clear_context_cache(cls) -> None:
+        """
+        Empties the cache of parsed units and resets its statistics.
+        """
+        cls.__context_cache.clear()
+        return
+
+
+
     def get_dimensional_part(self, base_dimension) -> int:
         try:
             if not base_dimension.IS_BASE_QUANTITY:
                 raise TypeError(f"{base_dimension.__name__} is not a base quantity.")
-            projection = base_dimension.DIMENSIONAL_ARRAY.as_array * self._DIMENSIONAL_ARRAY.as_array
-            return projection.sum()
+            return sum([exponent * base_exponent for exponent, base_exponent
+                        in zip(self._DIMENSIONAL_ARRAY, base_dimension.DIMENSIONAL_ARRAY)])
         except AttributeError:
             raise TypeError(f"Unrecognized type: {type(base_dimension)}. Only base quantity classes are accepted.")
 
@@ -350,9 +474,15 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
 
     def __init__(self, value: int | float | str, unit: str = None) -> None:
         try:
-            self._unit_map, self._factor_from_si = self.__class__.__context_cache[(self.__class__, unit)]
+            context_cache_key = self.__get_context_cache_key(value, unit)
+        except AttributeError:  # Neither @unit nor @value hold a unit string. Let the parser raise the right error.
+            self.__init_from_scratch(value, unit)
+            return
+        try:
+            self._unit_map, self._factor_from_si = self.__context_cache[context_cache_key]
         except KeyError:
             self.__init_from_scratch(value, unit)
+            self.__context_cache[context_cache_key] = (self._unit_map, self._factor_from_si)
         return
 
 
@@ -433,8 +563,8 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
         __add__ method is called. But in the second case, the first member is a simple int and the
         int __add__ magic method is called, which casts the second member as a simple float.
         """
-        converted_other = self.__try_conversion(other)
-        return self.__class__(float(self) + float(converted_other), self.symbol)
+        conversion_factor = self._get_conversion_factor(other)
+        return self._from_unit_map(float(self) + float(other) * conversion_factor, self._unit_map, self._factor_from_si)
 
 
 
@@ -477,8 +607,8 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
         dimensions.exceptions.IncompatibleUnitError.IncompatibleUnitError: Impossible to compare 1.0 g (Mass)
         and 1.0 m sec-1 (Speed): dimensions are different.
         """
-        converted_other = self.__try_conversion(other)
-        return self.__class__(float(self) - float(converted_other), self.symbol)
+        conversion_factor = self._get_conversion_factor(other)
+        return self._from_unit_map(float(self) - float(other) * conversion_factor, self._unit_map, self._factor_from_si)
 
 
 
@@ -542,7 +672,7 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
         float __mul__ method is called, which casts the second member as a simple float.
         """
         if type(other) in (float, int) or isinstance(other, number):  # number => numpy.core.number
-            return self.__class__(float(self) * other, self.symbol)
+            return self._from_unit_map(float(self) * other, self._unit_map, self._factor_from_si)
         other_class = other.__class__
         result_class = self.__class__ * other_class
         self_unit_map = self._unit_map.copy()
@@ -575,8 +705,9 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
             final_unit_map.append(self_unit_map_dict[dimension_class])
         for dimension_class in other_specific_dimensions:
             final_unit_map.append(other_unit_map_dict[dimension_class])
-        final_symbol = self.__get_unit_label(final_unit_map)
-        return result_class(float(self_aligned) * float(other), final_symbol)
+        final_unit_map.sort(reverse=True, key=lambda x: x.exponent)
+        factor_from_si = self.__get_factor_from_si(final_unit_map)
+        return result_class._from_unit_map(float(self_aligned) * float(other), final_unit_map, factor_from_si)
 
 
 
@@ -651,8 +782,9 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
                 UnitContext(-1 * context.exponent, context.elementary_unit, context.prefix)
                 for context in self._unit_map
             ]
-        inverted_symbol = self.__get_unit_label(sorted(new_unit_context, reverse=True, key=lambda x: x.exponent))
-        return inverted_class(1.0/float(self), inverted_symbol)
+        new_unit_context.sort(reverse=True, key=lambda x: x.exponent)
+        factor_from_si = self.__get_factor_from_si(new_unit_context)
+        return inverted_class._from_unit_map(1.0/float(self), new_unit_context, factor_from_si)
 
 
 
@@ -683,8 +815,9 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
                 UnitContext(exponent * context.exponent, context.elementary_unit, context.prefix)
                 for context in self._unit_map
             ]
-        new_symbol = self.__get_unit_label(sorted(new_unit_context, reverse=True, key=lambda x: x.exponent))
-        return new_class(pow(float(self), exponent, modulo), new_symbol)
+        new_unit_context.sort(reverse=True, key=lambda x: x.exponent)
+        factor_from_si = self.__get_factor_from_si(new_unit_context)
+        return new_class._from_unit_map(pow(float(self), exponent, modulo), new_unit_context, factor_from_si)
 
 
 
@@ -692,6 +825,33 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
 
 
 
+    # -----------------------#
+    #         Numpy          #
+    # -----------------------#
+
+    def __array_ufunc__(self, ufunc, method: str, *inputs, **kwargs):
+        """
+        @param ufunc        numpy.ufunc     The universal function called by numpy (np.add, np.sqrt, etc...)
+        @param method       str             The ufunc method called ('__call__', 'reduce', etc...)
+        @param inputs       tuple           The operands
+        @param kwargs       dict            Optional keyword arguments passed to the ufunc
+
+        @return             Any             The result of the ufunc, with the correct dimension
+
+        Magic method automatically called by numpy when a ufunc is applied on a quantity.
+        The dimension of the result is computed once per call, then numpy runs on raw floats.
+
+        Example:
+
+        >>> import numpy
+        >>> from dimensions import Surface
+        >>> numpy.sqrt(Surface(4.0, 'km2'))
+        2.0 km
+        """
+        return self._UFUNC_DISPATCHER.dispatch(ufunc, method, inputs, kwargs)
+
+
+
     # -----------------------#
     #       Comparison       #
     # -----------------------#
@@ -915,6 +1075,39 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
 
 
 
+    @classmethod
+    def _from_unit_map(cls, value: float, unit_map: list, factor_from_si: float):
+        """
+        @param value            float               A number, expressed in the unit described by @unit_map
+        @param unit_map         list                List of UnitContext objects, sorted by decreasing exponent
+        @param factor_from_si   float               The factor from the international system of @unit_map
+
+        @return                 AbstractQuantity    A new quantity of class @cls
+
+        Internal constructor used by the operators. Unlike the regular constructor, no unit string is
+        formatted or parsed: @unit_map and @factor_from_si are trusted and attached as is.
+        """
+        quantity = float.__new__(cls, value)
+        quantity._unit_map = unit_map
+        quantity._factor_from_si = factor_from_si
+        return quantity
+
+
+
+    def _get_conversion_factor(self, other) -> float:
+        """
+        @param other    AbstractQuantity        Another quantity
+
+        @return         float                   The factor to apply on a value expressed in the unit of @other
+                                                to express it in the unit of @self.
+
+        @raise          IncompatibleUnitError   if @other is not of the same dimensions as @self.
+        """
+        self.__raise_if_incompatible(other)
+        return other.factor_from_si / self._factor_from_si
+
+
+
     def _parse_unit_string(self, unit_as_string: str) -> list:
         metaclass = self.__class__.__class__
         split_units = unit_as_string.split()
@@ -980,27 +1173,89 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
 
 
     def __select_correct_candidates(self, candidates: list) -> tuple:
-        candidates = [c.items() for c in candidates]
-        combinaisons = product(*candidates)
-        for comb in combinaisons:
-            dimension_composition = {cls: umap[2] for cls, umap in comb}
-            try:
-                self.__check_dimension_composition(dimension_composition)
-                return tuple([umap for _, umap in comb])
-            except ValueError:
+        """
+        @param candidates       list            One {dimension class: (Prefix, Unit, exponent)} dict per unit token
+
+        @return                 tuple           One (Prefix, Unit, exponent) per unit token. Together, they compose
+                                                the dimensions of @self.
+
+        @raise                  ValueError      If no combination of candidates matches the dimensions of @self.
+
+        Each candidate is turned into a vector of 7 integer exponents, then a depth first search picks one
+        candidate per token. Tokens and candidates are visited in the same order as itertools.product would
+        enumerate them, so the first solution found is the same. A branch is cut as soon as, for one base
+        dimension, the remaining tokens can not bring the partial sum of exponents to the expected one.
+        Dead ends are remembered, so the search time grows linearly with the number of tokens.
+        """
+        target = tuple(self._DIMENSIONAL_ARRAY)
+        options = [self.__get_candidate_vectors(token_candidates) for token_candidates in candidates]
+        bounds = self.__get_remaining_exponent_bounds(options)
+        solution = self.__search_candidates(options, bounds, target, 0, (0,) * len(target), set())
+        if solution is None:
+            raise ValueError()
+        return tuple(solution)
+
+
+
+    @staticmethod
+    def __get_candidate_vectors(token_candidates: dict) -> list:
+        """
+        @return     list    [(exponents vector, (Prefix, Unit, exponent)), ...] for one unit token
+        """
+        vectors = list()
+        for dimension_class, context in token_candidates.items():
+            if dimension_class is None:  # Unit not registered in any dimension class
                 continue
-        raise ValueError()
+            exponent = context[2]
+            vectors.append((tuple(dimension_class.DIMENSIONAL_ARRAY * exponent), context))
+        return vectors
 
 
 
-    def __check_dimension_composition(self, dimension_composition: dict):
-        updated_dimensional_array = DimensionalArray(0, 0, 0, 0, 0, 0, 0).as_array
-        for dimension_class, exponent in dimension_composition.items():
-            dimensional_array = dimension_class.DIMENSIONAL_ARRAY.as_array
-            updated_dimensional_array = (dimensional_array * exponent) + updated_dimensional_array
-        if bool((updated_dimensional_array == self._DIMENSIONAL_ARRAY.as_array).prod()) is True:
-            return
-        raise ValueError()
+    @staticmethod
+    def __get_remaining_exponent_bounds(options: list) -> list:
+        """
+        @return     list    bounds[i] = (minimal vector, maximal vector) reachable by the tokens i, i+1, ..., n-1.
+                            bounds[n] is made of zeros.
+        """
+        lowest = highest = (0,) * len(AbstractQuantity._DIMENSIONAL_ARRAY)
+        bounds = [(lowest, highest)]
+        for token_options in reversed(options):
+            if not token_options:
+                raise ValueError()
+            vectors = [vector for vector, _ in token_options]
+            lowest = tuple([bound + min(column) for bound, column in zip(lowest, zip(*vectors))])
+            highest = tuple([bound + max(column) for bound, column in zip(highest, zip(*vectors))])
+            bounds.append((lowest, highest))
+        bounds.reverse()
+        return bounds
+
+
+
+    @classmethod
+    def __search_candidates(cls, options: list, bounds: list, target: tuple, index: int, partial: tuple,
+                            dead_ends: set) -> list | None:
+        """
+        @return     list | None     The candidates of tokens @index, @index+1, ..., or None if there is no solution
+                                    starting from the @partial sum of exponents of the previous tokens.
+        """
+        if (index, partial) in dead_ends:
+            return None
+        lowest, highest = bounds[index]
+        for expected, current, low, high in zip(target, partial, lowest, highest):
+            if not current + low <= expected <= current + high:
+                dead_ends.add((index, partial))
+                return None
+        if index == len(options):
+            return list()
+        for vector, context in options[index]:
+            new_partial = tuple([current + item for current, item in zip(partial, vector)])
+            solution = cls.__search_candidates(options, bounds, target, index + 1, new_partial, dead_ends)
+            if solution is not None:
+                solution.insert(0, context)
+                return solution
+        dead_ends.add((index, partial))
+        return None
 
 
 
@@ -1022,11 +1277,25 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
             msg = f"{unit} is not a valid unit for dimension {self.__class__.__name__}"
             raise BadUnitException(msg) from None
         self._factor_from_si = self.__get_factor_from_si(raw_contexts)
-        self.__class__.__context_cache[(self.__class__, unit)] = (self._unit_map, self._factor_from_si)
         return
 
 
 
+    def __get_context_cache_key(self, value: int | float | str, unit: str | None) -> tuple:
+        """
+        @return     tuple               (dimension class, normalized unit string)
+
+        @raise      AttributeError      If no unit string can be found in @unit or @value.
+
+        Equivalent spellings share the same key. For instance, 'km h-1', ' km  h-1' and '5 km h-1'
+        passed as value without unit all give (Speed, 'km h-1').
+        """
+        if unit is None:
+            unit = value.lstrip('-., 0123456789')
+        return self.__class__, ' '.join(unit.split())
+
+
+
     def __get_corresponding_protected_attribute_of_other_quantity(self, self_attribute_value, other_quantity):
         """
         @param self_attribute_value     Any                 An attribute of @self. For instance self._unit_map
@@ -1106,11 +1375,22 @@ class AbstractQuantity(float, metaclass=_MetaQuantity):
         It is called by mathematical and comparison magic method when the calling procedure
         tries to add two quantities, or check if a quantity is greater than another.
         """
+        conversion_factor = self._get_conversion_factor(other)
+        return self._from_unit_map(float(other) * conversion_factor, self._unit_map, self._factor_from_si)
+
+
+
+    def __raise_if_incompatible(self, other) -> None:
+        """
+        @param other    AbstractQuantity        Another quantity
+
+        @raise          IncompatibleUnitError   if @other is not of the same dimensions as @self.
+        """
         if not isinstance(other, self.__class__):
             error_message = f"Impossible to compare {self} ({self.__class__.__name__}) " \
                             f"and {other} ({other.__class__.__name__}): dimensions are different."
             raise IncompatibleUnitError(error_message)
-        return other.convert(self.symbol)
+        return
 
 
 
@@ -0,0 +1,147 @@
+from collections import OrderedDict
+
+
+
+class _LruCache(object):
+    """
+    Strictly internal class. A dictionary-like cache holding at most @max_size entries.
+    When full, the least recently used entry is evicted to make room for the new one.
+
+    Hits, misses and evictions are counted, so that the efficiency of the cache can be
+    monitored through the statistics property.
+
+    >>> cache = _LruCache(2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache['a']
+    1
+    >>> cache['c'] = 3  # 'b' is the least recently used entry, so it is evicted.
+    >>> 'b' in cache
+    False
+
+
+
+    ███████╗ ██╗      ██████╗ ████████╗ ███████╗
+    ██╔════╝ ██║     ██╔═══██╗╚══██╔══╝ ██╔════╝
+    ███████╗ ██║     ██║   ██║   ██║    ███████╗
+    ╚════██║ ██║     ██║   ██║   ██║    ╚════██║
+    ███████║ ███████╗╚██████╔╝   ██║    ███████║
+    ╚══════╝ ╚══════╝ ╚═════╝    ╚═╝    ╚══════╝
+
+    __entries       OrderedDict     The cached values. The most recently used entry is the last one.
+    __max_size      int | None      The maximum number of entries. None means unbounded.
+    __hits          int             Number of lookups which found their key.
+    __misses        int             Number of lookups which did not find their key.
+    __evictions     int             Number of entries removed to respect __max_size.
+    """
+
+    __slots__ = ('__entries', '__max_size', '__hits', '__misses', '__evictions')
+
+
+
+    def __init__(self, max_size: int | None = 1024) -> None:
+        self.__entries = OrderedDict()
+        self.__max_size = None
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.resize(max_size)
+        return
+
+
+
+    def resize(self, max_size: int | None) -> None:
+        """
+        @param max_size     int | None      The new maximum number of entries. None means unbounded.
+
+        @raise              ValueError      If @max_size is not a positive integer.
+
+        If the cache holds more than @max_size entries, the least recently used ones are evicted.
+        """
+        if max_size is not None and (not isinstance(max_size, int) or max_size < 1):
+            raise ValueError(f"Cache size must be a positive integer or None. However, size = {max_size}")
+        self.__max_size = max_size
+        self.__evict_overflow()
+        return
+
+
+
+    def clear(self) -> None:
+        """
+        Removes all the entries and resets the counters.
+        """
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        return
+
+
+
+    def __getitem__(self, key):
+        try:
+            value = self.__entries[key]
+        except KeyError:
+            self.__misses += 1
+            raise
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+        return value
+
+
+
+    def __setitem__(self, key, value) -> None:
+        self.__entries[key] = value
+        self.__entries.move_to_end(key)
+        self.__evict_overflow()
+        return
+
+
+
+    def __contains__(self, key) -> bool:
+        """
+        Membership test. Neither the counters nor the order of the entries are modified.
+        """
+        return key in self.__entries
+
+
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+
+    def __evict_overflow(self) -> None:
+        if self.__max_size is None:
+            return
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
+        return
+
+
+
+    def __get_statistics(self) -> dict:
+        """
+        statistics      -->     _       dict        Read Only
+
+        A snapshot of the cache usage:
+        {'size': 12, 'max_size': 1024, 'hits': 950, 'misses': 12, 'evictions': 0, 'hit_rate': 0.9875...}
+        """
+        lookups = self.__hits + self.__misses
+        return \
+            {
+                'size': len(self.__entries),
+                'max_size': self.__max_size,
+                'hits': self.__hits,
+                'misses': self.__misses,
+                'evictions': self.__evictions,
+                'hit_rate': self.__hits / lookups if lookups else 0.0
+            }
+
+    statistics = property(fget=__get_statistics, doc=f"{__get_statistics.__doc__}")
+
+    def __get_max_size(self) -> int | None:
+        return self.__max_size
+
+    max_size = property(fget=__get_max_size, doc=f"{__get_max_size.__doc__}")
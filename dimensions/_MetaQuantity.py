@@ -12,6 +12,9 @@ class _MetaQuantity(type):
         }
 
     __instances = dict()  # {(0, 0, 0, 0, 0, 0, 0): float}
+    __unit_index = dict()  # {Unit('m', 'meter'): Length, ...}
+    __algebra_cache = dict()  # {(Length, Time, '/', 1): Speed, (Length, None, '**', 2): Surface, ...}
+    __algebra_statistics = {'hits': 0, 'misses': 0, 'constructions': 0}
 
 
 
@@ -23,17 +26,42 @@ class _MetaQuantity(type):
         except KeyError:
             class_to_return = super(_MetaQuantity, mcs).__new__(mcs, user_friendly_name, bases, attributes)
             mcs.__instances[dimensional_array_as_tuple] = class_to_return
+            for unit in class_to_return.UNITS:  # First registered class owning a unit keeps it.
+                mcs.__unit_index.setdefault(unit, class_to_return)
         return class_to_return
 
 
 
     @classmethod
     def which_dimension_has(mcs, unit) -> type | None:
-        instances = [dimension_class for dimension_class in mcs.__instances.values() if dimension_class is not float]
-        for dimension_class in instances:
-            if unit in dimension_class.UNITS:
-                return dimension_class
-        return None
+        """
+        @param unit     Unit            An elementary unit, for instance meter
+
+        @return         type | None     The first registered dimension class having @unit in its UNITS (Length
+                                        for meter), or None if there is no such class.
+        """
+        return mcs.__unit_index.get(unit, None)
+
+
+
+    @classmethod
+    def get_algebra_cache_statistics(mcs) -> dict:
+        """
+        @return     dict        Usage of the cache of derived dimension classes:
+                                {'size': 12, 'hits': 950, 'misses': 12, 'constructions': 12}
+                                "constructions" counts the calls of the metaclass done to derive a class.
+                                In the steady state, it does not grow anymore.
+        """
+        return {'size': len(mcs.__algebra_cache), **mcs.__algebra_statistics}
+
+
+
+    @classmethod
+    def clear_algebra_cache(mcs) -> None:
+        mcs.__algebra_cache.clear()
+        for counter_name in mcs.__algebra_statistics:
+            mcs.__algebra_statistics[counter_name] = 0
+        return
 
 
 
@@ -44,14 +72,26 @@ class _MetaQuantity(type):
 
         :return:            type        A new class combining both.
         """
+        cache_key = (cls, other_cls, '*', 1)
+        try:
+            return cls.__read_algebra_cache(cache_key)
+        except KeyError:
+            pass
         new_dimensional_array = cls._DIMENSIONAL_ARRAY + other_cls.DIMENSIONAL_ARRAY
         new_unit_set = cls.__craft_new_unit_set(other_cls)
         new_class_name = f"{cls.__name__}_{other_cls.__name__}"
-        return cls.__craft_new_dimension_class(new_class_name, new_dimensional_array, new_unit_set)
+        new_class = cls.__craft_new_dimension_class(new_class_name, new_dimensional_array, new_unit_set)
+        cls.__algebra_cache[cache_key] = new_class
+        return new_class
 
 
 
     def __pow__(cls, power: int, modulo=None) -> type:
+        cache_key = (cls, None, '**', power)
+        try:
+            return cls.__read_algebra_cache(cache_key)
+        except KeyError:
+            pass
         new_dimensional_array = cls._DIMENSIONAL_ARRAY * power
         new_unit_set = dict()
         for unit_cls, exponent_cls in cls._UNITS.items():
@@ -59,7 +99,9 @@ class _MetaQuantity(type):
             if new_exponent != 0:
                 new_unit_set[unit_cls] = new_exponent
         new_class_name = f"{cls.__name__}{power}"
-        return cls.__craft_new_dimension_class(new_class_name, new_dimensional_array, new_unit_set)
+        new_class = cls.__craft_new_dimension_class(new_class_name, new_dimensional_array, new_unit_set)
+        cls.__algebra_cache[cache_key] = new_class
+        return new_class
 
 
 
@@ -69,7 +111,33 @@ class _MetaQuantity(type):
 
 
     def __truediv__(cls, other_cls):
-        return cls * ~other_cls
+        cache_key = (cls, other_cls, '/', 1)
+        try:
+            return cls.__read_algebra_cache(cache_key)
+        except KeyError:
+            pass
+        new_class = cls * ~other_cls
+        cls.__algebra_cache[cache_key] = new_class
+        return new_class
+
+
+
+    @classmethod
+    def __read_algebra_cache(mcs, cache_key: tuple) -> type:
+        """
+        @param cache_key    tuple       (class, other class or None, operator, power)
+
+        @return             type        The class derived by a previous identical operation
+
+        @raise              KeyError    If the operation was never done before.
+        """
+        try:
+            derived_class = mcs.__algebra_cache[cache_key]
+        except KeyError:
+            mcs.__algebra_statistics['misses'] += 1
+            raise
+        mcs.__algebra_statistics['hits'] += 1
+        return derived_class
 
 
 
@@ -80,6 +148,7 @@ class _MetaQuantity(type):
         class_attributes['_UNITS'] = unit_set
         class_attributes['_DIMENSIONAL_ARRAY'] = dimensional_array
         new_class = this_metaclass(class_name, (abstract_quantity_class,), class_attributes)
+        this_metaclass.__algebra_statistics['constructions'] += 1
         return new_class
 
 
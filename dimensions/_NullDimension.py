@@ -18,3 +18,12 @@ class _NullDimension(AbstractQuantity):
         This method just returns value cast as a float.
         """
         return float(value)
+
+
+
+    @classmethod
+    def _from_unit_map(cls, value: float, unit_map: list, factor_from_si: float) -> float:
+        """
+        Like __new__, the fast internal constructor just returns @value cast as a float.
+        """
+        return float(value)
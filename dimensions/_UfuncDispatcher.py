@@ -0,0 +1,209 @@
+from numpy import ndarray, asarray
+from numpy import add, subtract, multiply, divide, true_divide, reciprocal, square, sqrt, cbrt, power, float_power,\
+                  negative, positive, absolute, fabs, rint, floor, ceil, trunc, maximum, minimum, fmax, fmin, hypot,\
+                  fmod, remainder, equal, not_equal, less, less_equal, greater, greater_equal, isnan, isinf, isfinite,\
+                  signbit
+
+from QuantityArray import QuantityArray
+from __syntax import UnitContext
+from ._MetaQuantity import _MetaQuantity
+from .exceptions import IncompatibleUnitError
+
+
+
+class _UfuncDispatcher(object):
+    """
+    Strictly internal class implementing the numpy ufunc protocol (__array_ufunc__) for
+    QuantityArray objects and scalar quantities.
+
+    The dimension (and unit) of the result is worked out ONCE per call, on scalar unit
+    quantities (1 km, 1 m sec-1, etc...), through the regular operators of AbstractQuantity
+    and _MetaQuantity. Then the numeric kernel of the ufunc runs on the raw float buffers,
+    and the result is scaled by a single factor if units had to be aligned.
+
+    https://numpy.org/doc/stable/reference/arrays.classes.html#numpy.class.__array_ufunc__
+    """
+
+    # Result has the unit of the (single) input.
+    __UNIT_PRESERVING_UFUNCS = frozenset((negative, positive, absolute, fabs, rint, floor, ceil, trunc))
+    # Inputs must share the dimension. Second one is converted to the unit of the first one.
+    __SAME_DIMENSION_UFUNCS = frozenset((add, subtract, maximum, minimum, fmax, fmin, hypot, fmod, remainder))
+    __COMPARISON_UFUNCS = frozenset((equal, not_equal, less, less_equal, greater, greater_equal))
+    # Result is a simple boolean array. Units are irrelevant.
+    __PREDICATE_UFUNCS = frozenset((isnan, isinf, isfinite, signbit))
+    __ROOT_DEGREES = {sqrt: 2, cbrt: 3}
+    __REDUCIBLE_UFUNCS = frozenset((add, maximum, minimum, fmax, fmin))
+
+
+
+    @classmethod
+    def dispatch(cls, ufunc, method: str, inputs: tuple, kwargs: dict):
+        """
+        @param ufunc        numpy.ufunc     The universal function called by numpy (np.add, np.sqrt, etc...)
+        @param method       str             '__call__', 'reduce', 'accumulate' or 'outer'
+        @param inputs       tuple           The operands, quantities or not
+        @param kwargs       dict            Optional keyword arguments passed to the ufunc (out, where, etc...)
+
+        @return             Any             A QuantityArray, a scalar quantity, or a regular numpy object
+                                            if the result is adimensional.
+
+        @raise              IncompatibleUnitError   If the dimensions of the operands are not compatible with ufunc.
+        """
+        raw_inputs, units = zip(*[cls.__split_operand(operand) for operand in inputs])
+        if method in ('reduce', 'accumulate'):
+            if ufunc not in cls.__REDUCIBLE_UFUNCS:
+                return NotImplemented
+            return cls.__run_kernel(getattr(ufunc, method), raw_inputs, units[0], kwargs)
+        if method not in ('__call__', 'outer'):
+            return NotImplemented
+        kernel = ufunc if method == '__call__' else ufunc.outer
+        if ufunc in cls.__PREDICATE_UFUNCS:
+            return kernel(*raw_inputs, **kwargs)
+        if ufunc in cls.__UNIT_PRESERVING_UFUNCS:
+            return cls.__run_kernel(kernel, raw_inputs, units[0], kwargs)
+        if ufunc in cls.__SAME_DIMENSION_UFUNCS or ufunc in cls.__COMPARISON_UFUNCS:
+            first_unit, second_unit = units
+            cls.__raise_if_one_is_adimensional(ufunc, first_unit, second_unit)
+            raw_inputs = (raw_inputs[0], raw_inputs[1] * first_unit._get_conversion_factor(second_unit))
+            if ufunc in cls.__COMPARISON_UFUNCS:
+                return kernel(*raw_inputs, **kwargs)
+            return cls.__run_kernel(kernel, raw_inputs, first_unit, kwargs)
+        result_unit = cls.__get_result_unit(ufunc, raw_inputs, units)
+        return cls.__run_kernel(kernel, raw_inputs, result_unit, kwargs)
+
+
+
+    @classmethod
+    def __get_result_unit(cls, ufunc, raw_inputs: tuple, units: tuple):
+        """
+        @return     AbstractQuantity | float | None     The unit of the result, as a scalar quantity. Its value is the
+                                                        scale factor induced by unit alignment (for instance, 1 km * 1 m
+                                                        gives 1000 m2). A float means the result is adimensional.
+
+        @raise      IncompatibleUnitError               If the ufunc can not be applied on those units.
+        """
+        if ufunc is multiply:
+            first_unit, second_unit = units
+            if first_unit is None:
+                return second_unit
+            if second_unit is None:
+                return first_unit
+            return first_unit * second_unit
+        if ufunc in (divide, true_divide):
+            first_unit, second_unit = units
+            if second_unit is None:
+                return first_unit
+            if first_unit is None:
+                return ~second_unit
+            return first_unit / second_unit
+        if ufunc is reciprocal:
+            return ~units[0]
+        if ufunc is square:
+            return pow(units[0], 2)
+        if ufunc in (power, float_power):
+            if units[0] is None or units[1] is not None:
+                raise IncompatibleUnitError(f"Exponent of {ufunc.__name__} must be adimensional.")
+            return pow(units[0], cls.__get_integer_exponent(raw_inputs[1]))
+        if ufunc in cls.__ROOT_DEGREES:
+            return cls.__get_root_unit(units[0], cls.__ROOT_DEGREES[ufunc])
+        raise IncompatibleUnitError(f"numpy.{ufunc.__name__} can only be applied on adimensional values.")
+
+
+
+    @classmethod
+    def __run_kernel(cls, kernel, raw_inputs: tuple, result_unit, kwargs: dict):
+        """
+        @param kernel           Callable                    The ufunc (or one of its methods) to run on raw values
+        @param raw_inputs       tuple                       Operands, stripped from their units
+        @param result_unit      AbstractQuantity | float    The unit of the result, and the scale factor as value
+        @param kwargs           dict                        Keyword arguments passed to the kernel
+
+        @return                 Any                         The result of the kernel, tagged with @result_unit
+        """
+        outputs = kwargs.get('out', None)
+        if outputs is not None:
+            kwargs = dict(kwargs)
+            kwargs['out'] = tuple([output.as_array if isinstance(output, QuantityArray) else output for output in outputs])
+        raw_result = kernel(*raw_inputs, **kwargs)
+        scale = float(result_unit)
+        is_adimensional = not isinstance(result_unit.__class__, _MetaQuantity)
+        if outputs is not None:
+            return cls.__fill_output(outputs[0], kwargs['out'][0], result_unit, scale, is_adimensional)
+        if scale != 1.0:
+            raw_result = raw_result * scale
+        if is_adimensional:
+            return raw_result
+        dimension_class = result_unit.__class__
+        if isinstance(raw_result, ndarray):
+            return QuantityArray._wrap(raw_result, dimension_class, result_unit._unit_map, result_unit.factor_from_si)
+        return dimension_class._from_unit_map(float(raw_result), result_unit._unit_map, result_unit.factor_from_si)
+
+
+
+    @staticmethod
+    def __fill_output(output, raw_output: ndarray, result_unit, scale: float, is_adimensional: bool):
+        """
+        Handles the "out" keyword argument of ufuncs, for instance in-place operators such as "a *= b".
+        """
+        if scale != 1.0:
+            raw_output *= scale
+        if not isinstance(output, QuantityArray):
+            return output
+        if is_adimensional:
+            raise IncompatibleUnitError("An adimensional result can not be stored in a QuantityArray.")
+        output._dimension_class = result_unit.__class__
+        output._unit_map = result_unit._unit_map
+        output._factor_from_si = result_unit.factor_from_si
+        return output
+
+
+
+    @staticmethod
+    def __split_operand(operand) -> tuple:
+        """
+        @return     tuple       (raw numeric value, scalar unit quantity worth 1 or None if adimensional)
+        """
+        if isinstance(operand, QuantityArray):
+            return operand.as_array, operand.unit
+        if isinstance(operand.__class__, _MetaQuantity):
+            return float(operand), operand.__class__._from_unit_map(1.0, operand._unit_map, operand.factor_from_si)
+        return operand, None
+
+
+
+    @staticmethod
+    def __raise_if_one_is_adimensional(ufunc, first_unit, second_unit) -> None:
+        if first_unit is None or second_unit is None:
+            quantity_unit = first_unit if first_unit is not None else second_unit
+            error_message = f"Impossible to apply numpy.{ufunc.__name__} on {quantity_unit.symbol} " \
+                            f"({quantity_unit.__class__.__name__}) and an adimensional value."
+            raise IncompatibleUnitError(error_message)
+        return
+
+
+
+    @staticmethod
+    def __get_integer_exponent(exponent) -> int:
+        exponent_as_array = asarray(exponent)
+        if exponent_as_array.ndim != 0:
+            raise IncompatibleUnitError("Raising a quantity to an array of exponents would give mixed dimensions.")
+        integer_exponent = int(exponent_as_array)
+        if integer_exponent != exponent_as_array:
+            raise IncompatibleUnitError(f"Exponent must be an integer. However, exponent = {exponent}")
+        return integer_exponent
+
+
+
+    @staticmethod
+    def __get_root_unit(unit, degree: int):
+        root_contexts = list()
+        root_class = None
+        for context in unit._unit_map:
+            if context.exponent % degree != 0:
+                raise IncompatibleUnitError(f"Root of degree {degree} of {unit.symbol} is not a valid unit.")
+            root_exponent = context.exponent // degree
+            root_contexts.append(UnitContext(root_exponent, context.elementary_unit, context.prefix))
+            sub_dimension_class = pow(_MetaQuantity.which_dimension_has(context.elementary_unit), root_exponent)
+            root_class = sub_dimension_class if root_class is None else root_class * sub_dimension_class
+        root_symbol = ' '.join([context.symbol for context in root_contexts])
+        return root_class(1.0, root_symbol)
@@ -44,3 +44,18 @@ def test_unpickled_equal_original(conversion_table_init_data, supply_fuzzer):
             f"Original quantity is {'' if quantity.is_si else 'not '}expressed in an international unit " \
             f"while un-pickled quantity is{'' if unpickled_quantity.is_si else ' not'}."
     return
+
+
+
+@pytest.mark.parametrize('conversion_table_init_data', CONVERSION_TABLES_INIT_DATA.values())
+def test_unpickled_array_equal_original(conversion_table_init_data, supply_fuzzer):
+    dimension_class, data_generator = get_simple_data_generator(**conversion_table_init_data)
+    random_float = supply_fuzzer.logarithmic_randfloat()
+    for _, symbol in data_generator:
+        quantity_array = dimension_class.array([random_float, 1.0], symbol)
+        unpickled_array = get_unpickled_pickled_copy(quantity_array)
+        assert unpickled_array.dimension_class is quantity_array.dimension_class
+        assert unpickled_array.symbol == quantity_array.symbol
+        assert unpickled_array.factor_from_si == quantity_array.factor_from_si
+        assert unpickled_array.as_array[1] == 1.0
+    return
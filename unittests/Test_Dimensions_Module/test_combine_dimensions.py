@@ -62,3 +62,32 @@ def test_power_dimensions(right, exponent: int, expected_result_class):
     result_class = pow(right, exponent)
     assert result_class is expected_result_class
     return
+
+
+
+def test_steady_state_algebra_does_not_build_classes():
+    length, time = Length(3.0, 'km'), Time(2.0, 'h')
+    for _ in range(2):  # First round fills the cache.
+        statistics_before = Length.get_algebra_cache_statistics()
+        speed = length / time
+        surface = length * length
+        frequency = ~time
+        acceleration = speed / time
+        volume = pow(length, 3)
+        statistics_after = Length.get_algebra_cache_statistics()
+    assert (type(speed), type(surface), type(frequency), type(acceleration), type(volume)) == \
+           (Speed, Surface, Frequency, Acceleration, Volume)
+    assert statistics_after['constructions'] == statistics_before['constructions']
+    assert statistics_after['misses'] == statistics_before['misses']
+    assert statistics_after['hits'] > statistics_before['hits']
+    return
+
+
+
+@pytest.mark.parametrize('dimension_class', (Length, Time, Mass, Temperature, Pressure, Speed, Energy, Volume))
+def test_unit_owner_does_not_depend_on_derived_classes(dimension_class):
+    for exponent in range(2, 6):  # Derived classes also hold the units of their components.
+        _ = pow(dimension_class * Frequency, exponent)
+    for unit in dimension_class.UNITS:
+        assert dimension_class.which_dimension_has(unit) is dimension_class
+    return
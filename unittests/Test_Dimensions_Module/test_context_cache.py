@@ -0,0 +1,69 @@
+import pytest
+
+from dimensions import Length, Speed, Pressure, AbstractQuantity
+
+
+
+@pytest.fixture(scope='function')
+def small_context_cache():
+    AbstractQuantity.clear_context_cache()
+    AbstractQuantity.set_context_cache_size(3)
+    yield
+    AbstractQuantity.set_context_cache_size(1024)
+    AbstractQuantity.clear_context_cache()
+    return
+
+
+
+def test_cache_is_bounded_and_evicts_least_recently_used(small_context_cache):
+    Length(1, 'km')
+    Speed(1, 'km h-1')
+    Pressure(1, 'hPa')
+    Length(2, 'km')  # Refreshes 'km', so 'km h-1' becomes the least recently used unit.
+    Length(1, 'mil')
+    statistics = AbstractQuantity.get_context_cache_statistics()
+    assert statistics['size'] == 3
+    assert statistics['evictions'] == 1
+    assert (statistics['hits'], statistics['misses']) == (1, 4)
+    Length(3, 'km')
+    Speed(3, 'km h-1')
+    statistics = AbstractQuantity.get_context_cache_statistics()
+    assert (statistics['hits'], statistics['misses'], statistics['evictions']) == (2, 5, 2)
+    return
+
+
+
+def test_equivalent_spellings_share_one_entry(small_context_cache):
+    reference = Speed(1, 'km h-1')
+    quantities = (Speed(1, '  km   h-1 '), Speed('1 km h-1'), Speed('1km\th-1'))
+    statistics = AbstractQuantity.get_context_cache_statistics()
+    assert (statistics['size'], statistics['hits'], statistics['misses']) == (1, 3, 1)
+    for quantity in quantities:
+        assert quantity.symbol == reference.symbol
+        assert quantity == reference
+    return
+
+
+
+def test_units_in_value_strings_are_not_mixed_up(small_context_cache):
+    assert Length('3 km').symbol == 'km'
+    assert Length('3 mil').symbol == 'mil'
+    return
+
+
+
+def test_evicted_units_are_parsed_again(small_context_cache):
+    symbols = ('km', 'm', 'mil', 'ft', 'nmi', 'dam')
+    for _ in range(3):
+        for symbol in symbols:
+            assert Length(1, symbol).symbol == symbol
+    assert AbstractQuantity.get_context_cache_statistics()['size'] == 3
+    return
+
+
+
+@pytest.mark.parametrize('invalid_size', (0, -1, 2.5, '10'))
+def test_invalid_cache_size(invalid_size):
+    with pytest.raises(ValueError):
+        AbstractQuantity.set_context_cache_size(invalid_size)
+    return
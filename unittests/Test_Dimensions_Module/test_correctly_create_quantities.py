@@ -1,6 +1,9 @@
 import pytest
 from math import isnan
 
+from dimensions import Density, Force, Length
+from exceptions import BadUnitException
+
 from unittests.Test_Dimensions_Module.dependencies import ConversionArray, get_simple_data_generator
 from unittests.Test_Dimensions_Module.conftest import CONVERSION_TABLES_INIT_DATA
 
@@ -36,3 +39,16 @@ def test_instantiate_by_float(conversion_table_init_data, supply_fuzzer):
         assert isinstance(quantity, dimension_class)
         assert float(quantity) == random_float or (isnan(float(quantity)) and isnan(random_float))
     return
+
+
+
+@pytest.mark.parametrize('token_count', (1, 5, 20, 80))
+def test_long_ambiguous_units(token_count: int):
+    # 'g' is both gram and standard gravity. Each "g g-1" pair cancels out, whatever the interpretation.
+    quantity = Density(1.0, f"g cm-3 {'g g-1 ' * token_count}")
+    assert isinstance(quantity, Density)
+    assert quantity.factor_from_si == Density(1.0, 'g cm-3').factor_from_si
+    assert isinstance(Force(1.0, f"kg g {'m m-1 ' * token_count}"), Force)
+    with pytest.raises(BadUnitException):
+        Length(1.0, f"m {'g ' * token_count}")
+    return
@@ -0,0 +1,41 @@
+import pickle
+import pytest
+
+from DimensionalArray import DimensionalArray
+from dimensions import Length, Time, Speed, Surface, Pressure
+
+
+
+@pytest.mark.parametrize('dimension_class', (Length, Time, Speed, Surface, Pressure))
+def test_algebra_is_element_wise(dimension_class):
+    dimensional_array = dimension_class.DIMENSIONAL_ARRAY
+    assert len(dimensional_array + Speed.DIMENSIONAL_ARRAY) == 7
+    assert dimensional_array + Speed.DIMENSIONAL_ARRAY == \
+           tuple([exponent + speed_exponent for exponent, speed_exponent in zip(dimensional_array, Speed.DIMENSIONAL_ARRAY)])
+    assert dimensional_array * 3 == 3 * dimensional_array == tuple([3 * exponent for exponent in dimensional_array])
+    assert dimensional_array - dimensional_array == -dimensional_array + dimensional_array == DimensionalArray()
+    assert all([type(exponent) is int for exponent in dimensional_array * 2])
+    return
+
+
+
+def test_hashable_and_immutable():
+    speed_array = DimensionalArray(length_exponent=1, time_exponent=-1)
+    assert speed_array == Speed.DIMENSIONAL_ARRAY
+    assert {speed_array: Speed}[Length.DIMENSIONAL_ARRAY - Time.DIMENSIONAL_ARRAY] is Speed
+    with pytest.raises(TypeError):
+        speed_array[speed_array.LENGTH_INDEX] = 2
+    with pytest.raises(ValueError):
+        speed_array.as_array[0] = 2
+    assert pickle.loads(pickle.dumps(speed_array)) == speed_array
+    return
+
+
+
+def test_numpy_view_and_elementary():
+    assert Speed.DIMENSIONAL_ARRAY.as_array.tolist() == [1, -1, 0, 0, 0, 0, 0]
+    assert Length.DIMENSIONAL_ARRAY.is_elementary
+    assert Time.DIMENSIONAL_ARRAY.is_elementary
+    assert not Surface.DIMENSIONAL_ARRAY.is_elementary
+    assert not Speed.DIMENSIONAL_ARRAY.is_elementary
+    return
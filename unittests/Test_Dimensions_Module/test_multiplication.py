@@ -1,5 +1,5 @@
 import pytest
-from math import isnan
+from math import isnan, isclose
 
 from unittests.Test_Dimensions_Module.dependencies import get_simple_data_generator
 from unittests.Test_Dimensions_Module.conftest import MULTIPLICATION_DATA, CONVERSION_TABLES_INIT_DATA
@@ -38,3 +38,31 @@ def test_multiply_by_adimensional(conversion_table_init_data, supply_fuzzer):
             f"Multiplication by adimensional number has changed the dimension:\n" \
             f"{type(test_quantity)} x {random_number} --> {type(test_quantity)}"
     return
+
+
+
+@pytest.mark.parametrize('dimension_name1, dimension_name2, expected_type', MULTIPLICATION_DATA)
+def test_result_same_as_parsed_unit(dimension_name1: str, dimension_name2: str, expected_type):
+    dimension_class_1, data_generator1 = get_simple_data_generator(**CONVERSION_TABLES_INIT_DATA[dimension_name1])
+    dimension_class_2, data_generator2 = get_simple_data_generator(**CONVERSION_TABLES_INIT_DATA[dimension_name2])
+    for (test_number1, symbol1), (test_number2, symbol2) in zip(data_generator1, data_generator2):
+        quantity1 = dimension_class_1(test_number1, symbol1)
+        quantity2 = dimension_class_2(test_number2, symbol2)
+        multiplied_quantity = quantity1 * quantity2
+        parsed_quantity = expected_type(float(multiplied_quantity), multiplied_quantity.symbol)
+        assert multiplied_quantity.factor_from_si == parsed_quantity.factor_from_si
+        expected_si_value = float(quantity1) * quantity1.factor_from_si * float(quantity2) * quantity2.factor_from_si
+        assert isclose(float(multiplied_quantity) * multiplied_quantity.factor_from_si, expected_si_value, rel_tol=1e-9)
+    return
+
+
+
+@pytest.mark.parametrize('speed_symbol, time_symbol', (('m sec-1', 'min'), ('km h-1', 'sec'), ('mil h-1', 'ms')))
+def test_align_units_with_negative_exponents(speed_symbol: str, time_symbol: str):
+    from dimensions import Speed, Time, Length
+    speed, time = Speed(3.0, speed_symbol), Time(2.0, time_symbol)
+    expected_meters = 3.0 * speed.factor_from_si * 2.0 * time.factor_from_si
+    for length in (speed * time, time * speed):
+        assert type(length) is Length
+        assert isclose(float(length) * length.factor_from_si, expected_meters, rel_tol=1e-9)
+    return
@@ -0,0 +1,134 @@
+import numpy
+from array import array
+import pytest
+from math import isclose
+
+from QuantityArray import QuantityArray
+from dimensions import Length, Surface, Volume
+from dimensions.exceptions.IncompatibleUnitError import IncompatibleUnitError
+from unittests.Test_Dimensions_Module.dependencies import get_simple_data_generator
+from unittests.Test_Dimensions_Module.conftest import CONVERSION_TABLES_INIT_DATA, MULTIPLICATION_DATA
+
+
+
+@pytest.mark.parametrize('conversion_table_init_data', CONVERSION_TABLES_INIT_DATA.values())
+def test_array_has_same_unit_than_scalar(conversion_table_init_data):
+    dimension_class, data_generator = get_simple_data_generator(**conversion_table_init_data)
+    for test_number, symbol in data_generator:
+        quantity = dimension_class(test_number, symbol)
+        quantity_array = dimension_class.array([test_number, -test_number], symbol)
+        assert isinstance(quantity_array, QuantityArray)
+        assert quantity_array.dimension_class is dimension_class
+        assert quantity_array.symbol == quantity.symbol
+        assert quantity_array.factor_from_si == quantity.factor_from_si
+        assert float(quantity_array[0]) == float(quantity)
+        assert type(quantity_array[1]) is dimension_class
+    return
+
+
+
+@pytest.mark.parametrize('conversion_table_init_data', CONVERSION_TABLES_INIT_DATA.values())
+def test_convert_array_like_scalar(conversion_table_init_data, supply_fuzzer):
+    dimension_class, data_generator = get_simple_data_generator(**conversion_table_init_data)
+    test_values = list(data_generator)
+    for test_number, source_symbol in test_values:
+        _, target_symbol = supply_fuzzer.choice(test_values)
+        expected_quantity = dimension_class(test_number, source_symbol).convert(target_symbol)
+        converted_array = dimension_class.array([test_number, 2.0 * test_number], source_symbol).convert(target_symbol)
+        assert converted_array.symbol == expected_quantity.symbol
+        assert isclose(converted_array.as_array[0], float(expected_quantity), rel_tol=1e-9),\
+            f"Failed to convert {dimension_class.__name__} array in {target_symbol}."
+        assert isclose(converted_array.as_array[1], 2.0 * float(expected_quantity), rel_tol=1e-9),\
+            f"Failed to convert {dimension_class.__name__} array in {target_symbol}."
+    return
+
+
+
+@pytest.mark.parametrize('conversion_table_init_data', CONVERSION_TABLES_INIT_DATA.values())
+def test_add_arrays_like_scalars(conversion_table_init_data, supply_fuzzer):
+    dimension_class, data_generator = get_simple_data_generator(**conversion_table_init_data)
+    test_values = list(data_generator)
+    for test_number_1, symbol_1 in test_values:
+        test_number_2, symbol_2 = supply_fuzzer.choice(test_values)
+        expected_quantity = dimension_class(test_number_1, symbol_1) + dimension_class(test_number_2, symbol_2)
+        array_1 = dimension_class.array([test_number_1], symbol_1)
+        array_2 = dimension_class.array([test_number_2], symbol_2)
+        for final_array in (array_1 + array_2, numpy.add(array_1, dimension_class(test_number_2, symbol_2))):
+            assert isinstance(final_array, QuantityArray)
+            assert final_array.symbol == expected_quantity.symbol
+            assert isclose(final_array.as_array[0], float(expected_quantity), rel_tol=1e-9)
+        expected_comparison = dimension_class(test_number_1, symbol_1) < dimension_class(test_number_2, symbol_2)
+        assert bool((array_1 < array_2)[0]) is expected_comparison
+    return
+
+
+
+@pytest.mark.parametrize('dimension_name1, dimension_name2, expected_type', MULTIPLICATION_DATA)
+def test_multiply_arrays_yield_correct_dimension(dimension_name1: str, dimension_name2: str, expected_type):
+    dimension_class_1, data_generator1 = get_simple_data_generator(**CONVERSION_TABLES_INIT_DATA[dimension_name1])
+    dimension_class_2, data_generator2 = get_simple_data_generator(**CONVERSION_TABLES_INIT_DATA[dimension_name2])
+    for (test_number1, symbol1), (test_number2, symbol2) in zip(data_generator1, data_generator2):
+        expected_quantity = dimension_class_1(test_number1, symbol1) * dimension_class_2(test_number2, symbol2)
+        multiplied_array = dimension_class_1.array([test_number1], symbol1) * dimension_class_2.array([test_number2], symbol2)
+        assert multiplied_array.dimension_class is expected_type
+        assert multiplied_array.symbol == expected_quantity.symbol
+        assert isclose(multiplied_array.as_array[0], float(expected_quantity), rel_tol=1e-9)
+    return
+
+
+
+@pytest.mark.parametrize('conversion_table_init_data1', CONVERSION_TABLES_INIT_DATA.values())
+@pytest.mark.parametrize('conversion_table_init_data2', CONVERSION_TABLES_INIT_DATA.values())
+def test_properly_raise_if_incompatible_arrays(conversion_table_init_data1: dict, conversion_table_init_data2: dict):
+    dimension_class_1 = conversion_table_init_data1['test_dimension']
+    dimension_class_2 = conversion_table_init_data2['test_dimension']
+    if dimension_class_1 is dimension_class_2:
+        return
+    test_number_1, symbol_1 = next(get_simple_data_generator(**conversion_table_init_data1)[1])
+    test_number_2, symbol_2 = next(get_simple_data_generator(**conversion_table_init_data2)[1])
+    array_1 = dimension_class_1.array([test_number_1], symbol_1)
+    array_2 = dimension_class_2.array([test_number_2], symbol_2)
+    with pytest.raises(IncompatibleUnitError):
+        _ = array_1 + array_2
+    with pytest.raises(IncompatibleUnitError):
+        _ = array_1 < array_2
+    with pytest.raises(IncompatibleUnitError):
+        _ = array_1 + 1.0
+    return
+
+
+
+def test_root_of_quantities():
+    assert numpy.sqrt(Surface(4.0, 'km2')) == Length(2.0, 'km')
+    assert type(numpy.sqrt(Surface.array([4.0, 9.0], 'm2'))[1]) is Length
+    assert float(numpy.cbrt(Volume(27.0, 'm3'))) == 3.0
+    with pytest.raises(IncompatibleUnitError):
+        numpy.sqrt(Length(4.0, 'm'))
+    return
+
+
+
+@pytest.mark.parametrize('conversion_table_init_data', CONVERSION_TABLES_INIT_DATA.values())
+def test_bulk_constructors(conversion_table_init_data):
+    dimension_class, data_generator = get_simple_data_generator(**conversion_table_init_data)
+    for test_number, symbol in data_generator:
+        raw_values = array('d', [test_number, 2.0 * test_number])
+        expected_array = dimension_class.array(raw_values.tolist(), symbol)
+        buffer_array = dimension_class.from_buffer(raw_values, symbol)
+        bytes_array = dimension_class.from_buffer(memoryview(raw_values.tobytes()), symbol)
+        iterable_array = dimension_class.from_iterable(iter(raw_values), symbol)
+        for quantity_array in (buffer_array, bytes_array, iterable_array):
+            assert quantity_array.symbol == expected_array.symbol
+            assert quantity_array.factor_from_si == expected_array.factor_from_si
+            assert numpy.array_equal(quantity_array.as_array, expected_array.as_array, equal_nan=True)
+        assert numpy.shares_memory(buffer_array, numpy.asarray(raw_values))
+    return
+
+
+
+def test_from_buffer_does_not_copy_float64_arrays():
+    raw_values = numpy.arange(12.0).reshape(3, 4)
+    quantity_array = Length.from_buffer(raw_values, 'km')
+    assert numpy.shares_memory(quantity_array, raw_values)
+    assert quantity_array.shape == (3, 4)
+    return
@@ -0,0 +1,49 @@
+import pytest
+import dimensions
+from __syntax import Unit
+
+
+PREFIX_SYMBOLS = ('', 'da', 'Y', 'Z', 'E', 'P', 'T', 'G', 'M', 'k', 'K', 'h', 'H', 'd', 'c', 'm', 'µ', 'n', 'p', 'f', 'a', 'z', 'y')
+EXPONENTS = ('', '1', '2', '-1', '-3', '12', '-12')
+UNIT_SYMBOLS = sorted({unit.symbol for unit in Unit._Unit__instances.values()})
+
+
+
+def match_all_units(raw_symbol: str) -> tuple:
+    """
+    Reference implementation: the linear scan over all the units, as done before the index existed.
+    """
+    matches = list()
+    for unit in Unit._Unit__instances.values():
+        match = unit.match_raw_symbol(raw_symbol)
+        if match != (None, None, None):
+            matches.append(match)
+    return tuple(matches)
+
+
+
+@pytest.mark.parametrize('unit_symbol', UNIT_SYMBOLS)
+def test_index_matches_linear_scan(unit_symbol: str):
+    for prefix_symbol in PREFIX_SYMBOLS:
+        for exponent in EXPONENTS:
+            raw_symbol = f"{prefix_symbol}{unit_symbol}{exponent}"
+            expected = match_all_units(raw_symbol)
+            if not expected:
+                with pytest.raises(ValueError):
+                    Unit.get_unit_from_raw_symbol(raw_symbol)
+                continue
+            found = Unit.get_unit_from_raw_symbol(raw_symbol)
+            assert [(prefix.symbol, unit, exp) for prefix, unit, exp in found] == \
+                   [(prefix.symbol, unit, exp) for prefix, unit, exp in expected], f"Mismatch for {raw_symbol}"
+    return
+
+
+
+def test_new_unit_is_indexed():
+    Unit.get_unit_from_raw_symbol('m')  # Ensures the index is built.
+    with pytest.raises(ValueError):
+        Unit.get_unit_from_raw_symbol('kzorglub2')
+    zorglub = Unit('zorglub', 'zorglub unit for testing purpose')
+    prefix, unit, exponent = Unit.get_unit_from_raw_symbol('kzorglub2')[0]
+    assert (prefix.symbol, unit, exponent) == ('k', zorglub, 2)
+    return